@@ -11,8 +11,9 @@ Bài toán:
 
 import time
 import logging
-from typing import Dict, List, Optional
-from src.algorithms.base import BaseAlgorithm
+from typing import Dict, Iterator, List, Optional
+from src.algorithms.base import Hint
+from src.algorithms.football import FootballMatch, FootballScheduler
 from src.core.models import Solution
 from src.core.problem import SchedulingProblem
 
@@ -20,23 +21,7 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class FootballMatch:
-    """Đại diện cho một trận đấu"""
-    def __init__(self, match_id: int, team1_id: int, team2_id: int, 
-                 team1_name: str = "", team2_name: str = ""):
-        self.match_id = match_id
-        self.team1_id = team1_id
-        self.team2_id = team2_id
-        self.team1_name = team1_name
-        self.team2_name = team2_name
-    
-    def __repr__(self):
-        if self.team1_name and self.team2_name:
-            return f"Match({self.team1_name} vs {self.team2_name})"
-        return f"Match({self.team1_id} vs {self.team2_id})"
-
-
-class BacktrackingScheduler(BaseAlgorithm):
+class BacktrackingScheduler(FootballScheduler):
     """
     Sắp xếp lịch thi đấu bóng đá bằng Backtracking
     
@@ -46,84 +31,51 @@ class BacktrackingScheduler(BaseAlgorithm):
     3. Mỗi đội thi đấu với mỗi đội khác đúng 1 lần
     """
     
+    # Số nút tối đa khi tìm lịch ngắn hơn lời giải incumbent
+    IMPROVE_NODE_LIMIT = 20000
+    
     def __init__(self, problem: SchedulingProblem, num_teams: int = 8, 
                  min_rest_days: int = 2, team_names: Dict[int, str] = None):
-        super().__init__(problem)
-        self.num_teams = num_teams
-        self.min_rest_days = min_rest_days
-        
-        # Danh sách tên đội
-        if team_names is None:
-            self.team_names = {i: f"Đội {i}" for i in range(num_teams)}
-        else:
-            self.team_names = team_names
-        
-        # Tạo danh sách tất cả các trận đấu
-        self.matches = self._generate_matches()
-        self.total_matches = len(self.matches)
-        
-        # Lịch: match_id -> day (ngày thi đấu)
-        self.schedule = {}
-        
-        # Lịch sử thi đấu của mỗi đội: team_id -> [day1, day2, ...]
-        self.team_play_days = {i: [] for i in range(num_teams)}
-        
-        # Số trận tối đa mỗi ngày
-        self.max_matches_per_day = 2
+        super().__init__(problem, num_teams, min_rest_days, team_names)
         
-        # Số ngày cần thiết: tối thiểu là ceil(total_matches / 2)
-        self.num_days_needed = (self.total_matches + self.max_matches_per_day - 1) // self.max_matches_per_day
-        
-        self.stats = {
-            'nodes_explored': 0,
-            'backtrack_count': 0,
-            'solutions_found': 0
-        }
-        
-        logger.info(f"✓ Initialized Football Scheduler: {num_teams} teams, "
-                   f"{self.total_matches} matches, min {self.num_days_needed} days needed")
-    
-    def _generate_matches(self) -> List[FootballMatch]:
-        """
-        Tạo tất cả các trận đấu (vòng tròn)
-        Mỗi đội thi đấu với mỗi đội khác đúng 1 lần
-        """
-        matches = []
-        match_id = 0
-        
-        for team1_id in range(self.num_teams):
-            for team2_id in range(team1_id + 1, self.num_teams):
-                team1_name = self.team_names[team1_id]
-                team2_name = self.team_names[team2_id]
-                
-                matches.append(FootballMatch(
-                    match_id, team1_id, team2_id, 
-                    team1_name, team2_name
-                ))
-                match_id += 1
-        
-        return matches
+        # Cận trên của makespan (từ lịch gợi ý hợp lệ)
+        self.upper_bound = None
     
     def get_name(self) -> str:
         return "Backtracking"
     
-    def solve(self) -> Solution:
-        """Giải bài toán sắp xếp lịch thi đấu"""
-        start_time = time.time()
+    def solve(self, hint: Optional[Hint] = None,
+              fixed: Optional[Hint] = None) -> Solution:
+        """
+        Giải bài toán sắp xếp lịch thi đấu
         
-        # Reset
-        self.schedule = {}
-        self.team_play_days = {i: [] for i in range(self.num_teams)}
-        self.stats = {
-            'nodes_explored': 0,
-            'backtrack_count': 0,
-            'solutions_found': 0
-        }
+        Args:
+            hint: Lịch gợi ý match_id -> day (vd. lịch mùa trước). Ngày gợi ý
+                được thử đầu tiên cho mỗi trận; nếu là lịch đầy đủ và hợp lệ
+                thì nó là lời giải incumbent: tìm kiếm chỉ nhận lịch ngắn hơn
+                (tối đa IMPROVE_NODE_LIMIT nút), không có thì trả về incumbent
+            fixed: Lịch cố định một phần match_id -> day, giữ nguyên khi tìm kiếm
+        """
+        start_time = time.time()
         
         logger.info("🔍 Bắt đầu sắp xếp lịch thi đấu...")
         
-        # Chạy backtracking
-        self._backtrack(0, 0)  # match_idx=0, day=0
+        incumbent = self._prepare(hint, fixed)
+        if incumbent:
+            logger.info(f"✓ Lịch gợi ý hợp lệ: cận trên {self.upper_bound} ngày")
+        
+        # Đặt các trận cố định trước khi tìm kiếm
+        if self._place_all(self.fixed):
+            # Chạy backtracking
+            if self._backtrack(0, 0):  # match_idx=0, day=0
+                logger.info(f"✓ Lịch thi đấu #{self.stats['solutions_found']} tìm được!")
+        else:
+            logger.warning("❌ Lịch cố định không hợp lệ")
+            self.schedule = {}
+        
+        # Không tìm được lịch ngắn hơn incumbent -> dùng lại lời giải incumbent
+        if len(self.schedule) < self.total_matches:
+            self.schedule = dict(incumbent) if incumbent else {}
         
         execution_time = time.time() - start_time
         
@@ -156,163 +108,135 @@ class BacktrackingScheduler(BaseAlgorithm):
             statistics=self.stats
         )
     
-    def _is_valid_placement(self, match_idx: int, day: int) -> bool:
-        """
-        Kiểm tra xem có thể đặt trận đấu tại ngày này không
-        
-        Kiểm tra:
-        1. Số trận trong ngày không vượt 2
-        2. Mỗi đội có ít nhất 2 ngày nghỉ giữa các trận
+    def iter_solutions(self, hint: Optional[Hint] = None,
+                       fixed: Optional[Hint] = None) -> Iterator[Solution]:
         """
-        match = self.matches[match_idx]
-        team1 = match.team1_id
-        team2 = match.team2_id
+        Liệt kê lần lượt các lịch hợp lệ (dùng cho chế độ đa mục tiêu)
         
-        # Kiểm tra số trận tối đa trong ngày
-        matches_today = sum(1 for m_id, d in self.schedule.items() if d == day)
-        if matches_today >= self.max_matches_per_day:
-            return False
+        Thứ tự tìm kiếm giống solve() nhưng không giới hạn bởi cận trên của
+        lịch gợi ý, để không bỏ sót các lịch dài hơn nhưng cân bằng hơn.
         
-        # Kiểm tra hai đội không cùng thi đấu cùng ngày
-        for m_id, d in self.schedule.items():
-            if d == day:
-                m = self.matches[m_id]
-                if team1 in (m.team1_id, m.team2_id) or team2 in (m.team1_id, m.team2_id):
-                    return False
-        
-        # Kiểm tra rest days cho team1
-        if self.team_play_days[team1]:
-            last_play_day = max(self.team_play_days[team1])
-            if day - last_play_day < self.min_rest_days + 1:
-                return False
+        Lưu ý: đây là DFS liệt kê từ lời giải đầu tiên, các lịch liên tiếp chỉ
+        khác nhau ở vài trận cuối nên chỉ phủ một vùng nhỏ quanh lời giải đó
+        (vd. makespan 67-69 với 8 đội). Dòng lời giải đa dạng cho Pareto front
+        lấy từ DSaturScheduler.iter_solutions().
+        """
+        start_time = time.time()
         
-        # Kiểm tra rest days cho team2
-        if self.team_play_days[team2]:
-            last_play_day = max(self.team_play_days[team2])
-            if day - last_play_day < self.min_rest_days + 1:
-                return False
+        self._prepare(hint, fixed)
+        self.upper_bound = None
+        if not self._place_all(self.fixed):
+            logger.warning("❌ Lịch cố định không hợp lệ")
+            return
         
-        return True
+        for _ in self._search(0, 0):
+            yield Solution(
+                schedule=self.schedule.copy(),
+                makespan=max(self.schedule.values()) + 1,
+                total_cost=0.0,
+                algorithm=self.get_name(),
+                execution_time=time.time() - start_time,
+                statistics=dict(self.stats)
+            )
     
-    def _place_match(self, match_idx: int, day: int):
-        """Đặt trận đấu vào lịch"""
-        match = self.matches[match_idx]
-        self.schedule[match_idx] = day
+    def _prepare(self, hint: Optional[Hint], fixed: Optional[Hint]) -> Optional[Dict[int, int]]:
+        """
+        Reset trạng thái, đọc lịch gợi ý / cố định
         
-        # Cập nhật ngày thi đấu của mỗi đội
-        if day not in self.team_play_days[match.team1_id]:
-            self.team_play_days[match.team1_id].append(day)
-        if day not in self.team_play_days[match.team2_id]:
-            self.team_play_days[match.team2_id].append(day)
+        Returns:
+            Lịch gợi ý nếu nó đầy đủ, hợp lệ và khớp lịch cố định (incumbent),
+            khi đó makespan của nó được dùng làm cận trên (self.upper_bound)
+        """
+        self._reset_state()
+        self._reset_stats()
+        self.hint = self._hint_to_schedule(hint)
+        self.fixed = self._hint_to_schedule(fixed)
+        self.upper_bound = None
+        
+        if (len(self.hint) == self.total_matches
+                and all(self._is_usable_hint_day(d) for d in self.hint.values())
+                and all(self.hint.get(m_id) == d for m_id, d in self.fixed.items())
+                and self._is_feasible(self.hint)):
+            self.upper_bound = max(self.hint.values()) + 1
+            return self.hint
+        return None
     
-    def _remove_match(self, match_idx: int):
-        """Gỡ trận đấu khỏi lịch"""
-        if match_idx not in self.schedule:
-            return
-        
-        match = self.matches[match_idx]
-        day = self.schedule[match_idx]
-        del self.schedule[match_idx]
-        
-        # Cập nhật team play days
-        self.team_play_days[match.team1_id] = [d for d in self.team_play_days[match.team1_id]
-                                                if d in [self.schedule.get(m_id) for m_id in self.schedule]]
-        self.team_play_days[match.team2_id] = [d for d in self.team_play_days[match.team2_id]
-                                                if d in [self.schedule.get(m_id) for m_id in self.schedule]]
-        
-        self.stats['backtrack_count'] += 1
+    def _candidate_days(self, match_idx: int, current_day: int) -> List[int]:
+        """
+        Thứ tự giá trị (ngày) thử cho một trận: ngày gợi ý trước, sau đó
+        các ngày từ current_day. Khi có incumbent chỉ nhận ngày < upper_bound - 1
+        (lịch ngắn hơn hẳn incumbent)
+        """
+        # Trận gợi ý có thể nằm sau current_day: cửa sổ tính từ ngày xa nhất
+        latest_day = max((mask.bit_length() - 1 for mask in self.team_day_masks.values()),
+                         default=-1)
+        last_day = max(current_day, latest_day) + 20  # Giới hạn tìm kiếm
+        if self.upper_bound is not None:
+            last_day = min(last_day, self.upper_bound - 1)
+        days = list(range(current_day, last_day))
+        
+        # Gợi ý chỉ mang tính tham khảo: bỏ qua ngày âm hoặc nằm ngoài cửa sổ
+        # tìm kiếm (quá xa các trận đã đặt, hoặc vượt cận trên)
+        hinted_day = self.hint.get(match_idx)
+        if hinted_day is not None and 0 <= hinted_day < last_day:
+            if hinted_day in days:
+                days.remove(hinted_day)
+            days.insert(0, hinted_day)
+        
+        return days
     
     def _backtrack(self, match_idx: int, current_day: int) -> bool:
         """
-        Thuật toán backtracking chính
+        Thuật toán backtracking chính: dừng ở lịch đầu tiên tìm được
+        (lịch vẫn nằm trong self.schedule)
         
         Args:
             match_idx: Chỉ số trận đấu cần sắp xếp
             current_day: Ngày hiện tại
         """
+        for _ in self._search(match_idx, current_day):
+            return True
+        return False
+    
+    def _search(self, match_idx: int, current_day: int) -> Iterator[None]:
+        """
+        Duyệt backtracking dạng generator: yield mỗi khi self.schedule
+        chứa một lịch đầy đủ
+        """
         self.stats['nodes_explored'] += 1
         
+        # Tìm lịch ngắn hơn incumbent có giới hạn số nút
+        if self.upper_bound is not None and self.stats['nodes_explored'] > self.IMPROVE_NODE_LIMIT:
+            return
+        
         # Base case: tất cả trận đấu đã được sắp xếp
         if match_idx == self.total_matches:
             self.stats['solutions_found'] += 1
-            logger.info(f"✓ Lịch thi đấu #{self.stats['solutions_found']} tìm được!")
-            return True
+            yield
+            return
         
-        # Thử từng ngày bắt đầu từ current_day
-        for day in range(current_day, current_day + 20):  # Giới hạn tìm kiếm
+        # Trận cố định đã được đặt sẵn
+        if match_idx in self.fixed:
+            yield from self._search(match_idx + 1, current_day)
+            return
+        
+        # Thử ngày gợi ý trước, sau đó từng ngày bắt đầu từ current_day
+        hinted_day = self.hint.get(match_idx)
+        for day in self._candidate_days(match_idx, current_day):
             if self._is_valid_placement(match_idx, day):
+                if day == hinted_day:
+                    self.stats['hint_hits'] += 1
+                
                 # Đặt trận
                 self._place_match(match_idx, day)
                 
-                # Tiếp tục backtrack
-                next_day = max(current_day, day)
-                if self._backtrack(match_idx + 1, next_day):
-                    return True
+                # Tiếp tục backtrack; ngày gợi ý không đẩy cửa sổ tìm kiếm
+                # (kiểm tra ràng buộc không phụ thuộc thứ tự đặt trận)
+                next_day = current_day if day == hinted_day else max(current_day, day)
+                yield from self._search(match_idx + 1, next_day)
                 
                 # Backtrack
                 self._remove_match(match_idx)
-        
-        return False
-    
-    def print_schedule(self, schedule: Dict[int, int] = None):
-        """In lịch thi đấu"""
-        if schedule is None:
-            schedule = self.schedule
-        
-        if not schedule:
-            logger.warning("Không có lịch để hiển thị")
-            return
-        
-        print("\n" + "="*80)
-        print("⚽ LỊCH THI ĐẤU BÓNG ĐÁ - VÒNG TRÒN")
-        print("="*80)
-        
-        # Sắp xếp theo ngày
-        days_matches = {}
-        for match_id, day in sorted(schedule.items(), key=lambda x: x[1]):
-            if day not in days_matches:
-                days_matches[day] = []
-            days_matches[day].append(match_id)
-        
-        # In theo ngày
-        for day in sorted(days_matches.keys()):
-            print(f"\n📅 NGÀY {day + 1}:")
-            print("-" * 80)
-            for match_id in days_matches[day]:
-                match = self.matches[match_id]
-                print(f"  Trận {match_id + 1}: {match.team1_name} vs {match.team2_name}")
-        
-        # Thống kê
-        total_days = max(schedule.values()) + 1 if schedule else 0
-        
-        print("\n" + "="*80)
-        print("📊 THỐNG KÊ")
-        print("="*80)
-        print(f"Tổng số trận: {len(schedule)}")
-        print(f"Tổng số ngày: {total_days}")
-        print(f"Trận/ngày: {len(schedule) / total_days:.1f} (Tối đa: {self.max_matches_per_day})")
-        
-        # In lịch thi đấu theo đội
-        print("\n" + "-"*80)
-        print("📋 LỊCH THAM DỰ CỦA MỖI ĐỘI")
-        print("-"*80)
-        
-        for team_id in range(self.num_teams):
-            matches = [(match_id, schedule[match_id]) 
-                      for match_id in schedule 
-                      if team_id in (self.matches[match_id].team1_id, self.matches[match_id].team2_id)]
-            
-            matches.sort(key=lambda x: x[1])
-            
-            team_name = self.team_names[team_id]
-            print(f"\n🏆 {team_name}:")
-            for match_id, day in matches:
-                match = self.matches[match_id]
-                opponent_id = match.team2_id if match.team1_id == team_id else match.team1_id
-                opponent_name = self.team_names[opponent_id]
-                print(f"  Ngày {day + 1}: vs {opponent_name}")
-        
-        print("\n" + "="*80 + "\n")
     
     def print_statistics(self):
         """In thống kê"""
@@ -322,4 +246,5 @@ class BacktrackingScheduler(BaseAlgorithm):
         print(f"Nodes explored: {self.stats['nodes_explored']}")
         print(f"Backtrack count: {self.stats['backtrack_count']}")
         print(f"Solutions found: {self.stats['solutions_found']}")
+        print(f"Hint hits: {self.stats['hint_hits']}")
         print("="*80 + "\n")
\ No newline at end of file
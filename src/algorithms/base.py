@@ -1,11 +1,14 @@
 # src/algorithms/base.py
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Union
 
 if TYPE_CHECKING:
     from src.core.problem import SchedulingProblem
     from src.core.models import Solution
 
+# Gợi ý lời giải: một Solution có sẵn hoặc dict id -> thời điểm
+Hint = Union['Solution', Dict[int, int]]
+
 
 class BaseAlgorithm(ABC):
     """Base class cho tất cả thuật toán"""
@@ -14,15 +17,42 @@ class BaseAlgorithm(ABC):
         self.problem = problem
         
     @abstractmethod
-    def solve(self) -> 'Solution':
-        """Giải quyết bài toán - các lớp con phải implement"""
+    def solve(self, hint: Optional[Hint] = None,
+              fixed: Optional[Hint] = None) -> 'Solution':
+        """
+        Giải quyết bài toán - các lớp con phải implement
+        
+        Args:
+            hint: Lời giải gợi ý (warm start), được thử trước khi chọn giá trị
+            fixed: Lịch cố định một phần, các phần tử này không được thay đổi
+        """
         pass
     
+    def iter_solutions(self, hint: Optional[Hint] = None,
+                       fixed: Optional[Hint] = None) -> Iterator['Solution']:
+        """
+        Dòng các lời giải ứng viên (cho chế độ đa mục tiêu)
+        
+        Mặc định chỉ trả về kết quả của solve(); thuật toán nào liệt kê được
+        nhiều lời giải thì override.
+        """
+        solution = self.solve(hint=hint, fixed=fixed)
+        if solution.schedule:
+            yield solution
+    
     @abstractmethod
     def get_name(self) -> str:
         """Lấy tên thuật toán"""
         pass
     
+    @staticmethod
+    def _hint_to_schedule(hint: Optional[Hint]) -> Dict[int, int]:
+        """Chuẩn hóa gợi ý (Solution / dict / None) thành dict id -> thời điểm"""
+        if hint is None:
+            return {}
+        schedule = getattr(hint, 'schedule', hint)
+        return {int(k): int(v) for k, v in schedule.items()}
+    
     def validate_solution(self, solution: 'Solution') -> bool:
         """Kiểm tra solution có hợp lệ không"""
         if not solution.schedule:
@@ -0,0 +1,166 @@
+"""
+Sắp xếp lịch thi đấu bóng đá - DSATUR (tô màu đồ thị xung đột)
+File: src/algorithms/dsatur.py
+
+Mỗi ngày là một "màu" trên đồ thị xung đột giữa các trận (hai trận có
+chung đội). Thuật toán tham lam DSATUR:
+- Chọn trận chưa xếp có độ bão hòa lớn nhất (số ngày khác nhau đã bị các
+  trận kề chiếm), hòa thì chọn trận có bậc (trong phần chưa xếp) lớn nhất
+- Gán ngày sớm nhất thỏa sức chứa ngày và số ngày nghỉ
+
+Không quay lui nên rất nhanh với giải có hàng trăm trận; lời giải dùng được
+làm gợi ý (cận trên + thứ tự giá trị) cho BacktrackingScheduler.
+
+iter_solutions() chạy lại DSATUR nhiều lần với tie-breaking ngẫu nhiên và số
+ngày nghỉ mục tiêu giãn ra, tạo dòng lời giải đa dạng cho chế độ đa mục tiêu
+(mùa giải ngắn / ngày nghỉ đều / ít break sân nhà - sân khách).
+"""
+
+import time
+import random
+import logging
+from typing import Iterator, Optional
+from src.algorithms.base import Hint
+from src.algorithms.football import FootballScheduler
+from src.core.models import Solution
+
+logger = logging.getLogger(__name__)
+
+
+class DSaturScheduler(FootballScheduler):
+    """Sắp xếp lịch thi đấu bằng tô màu DSATUR trên đồ thị xung đột"""
+
+    def get_name(self) -> str:
+        return "DSATUR"
+
+    def solve(self, hint: Optional[Hint] = None,
+              fixed: Optional[Hint] = None) -> Solution:
+        """
+        Gán ngày cho các trận bằng DSATUR
+
+        Args:
+            hint: Lịch gợi ý match_id -> day, ngày gợi ý được thử trước ngày sớm nhất
+            fixed: Lịch cố định một phần match_id -> day
+        """
+        start_time = time.time()
+
+        self._reset_state()
+        self._reset_stats()
+        self.hint = self._hint_to_schedule(hint)
+        self.fixed = self._hint_to_schedule(fixed)
+
+        if self._place_all(self.fixed):
+            self._color()
+            self.stats['solutions_found'] = 1
+        else:
+            logger.warning("❌ Lịch cố định không hợp lệ")
+            self._reset_state()
+
+        execution_time = time.time() - start_time
+        makespan = max(self.schedule.values()) + 1 if self.schedule else 0
+
+        if self.schedule:
+            logger.info(f"✓ DSATUR: {makespan} ngày")
+
+        return Solution(
+            schedule=self.schedule.copy(),
+            makespan=makespan,
+            total_cost=0.0,
+            algorithm=self.get_name(),
+            execution_time=execution_time,
+            statistics=self.stats
+        )
+
+    def iter_solutions(self, hint: Optional[Hint] = None,
+                       fixed: Optional[Hint] = None, restarts: int = 1000,
+                       max_extra_rest: int = 2, seed: int = 0) -> Iterator[Solution]:
+        """
+        Dòng lời giải đa dạng: lời giải DSATUR thường, sau đó restarts lần chạy
+        ngẫu nhiên
+        
+        Mỗi lần chạy ngẫu nhiên: hòa độ bão hòa / bậc thì chọn ngẫu nhiên, và
+        mỗi trận ưu tiên ngày thỏa số ngày nghỉ lớn hơn (min_rest_days + một
+        số ngẫu nhiên trong [0, max_extra_rest]) -> mùa giải dài hơn nhưng
+        ngày nghỉ / thứ tự sân nhà - sân khách khác đi.
+        """
+        solution = self.solve(hint=hint, fixed=fixed)
+        if not solution.schedule:
+            return
+        yield solution
+        
+        rng = random.Random(seed)
+        for _ in range(restarts):
+            start_time = time.time()
+            self._reset_state()
+            self._reset_stats()
+            self._place_all(self.fixed)
+            self._color(rng, max_extra_rest)
+            self.stats['solutions_found'] = 1
+            
+            yield Solution(
+                schedule=self.schedule.copy(),
+                makespan=max(self.schedule.values()) + 1,
+                total_cost=0.0,
+                algorithm=self.get_name(),
+                execution_time=time.time() - start_time,
+                statistics=dict(self.stats)
+            )
+    
+    def _color(self, rng: Optional[random.Random] = None, max_extra_rest: int = 0):
+        """
+        Vòng lặp DSATUR chính
+        
+        Args:
+            rng: Nếu có, hòa thì chọn ngẫu nhiên và giãn số ngày nghỉ mục tiêu
+            max_extra_rest: Số ngày nghỉ thêm tối đa (chỉ dùng khi có rng)
+        """
+        graph = self.conflict_graph
+
+        # Ngày đã bị các trận kề chiếm và bậc trong phần chưa xếp
+        neighbor_days = [set() for _ in range(self.total_matches)]
+        uncolored_degree = [graph.degree(m) for m in range(self.total_matches)]
+        uncolored = set(range(self.total_matches))
+
+        for match_idx, day in self.schedule.items():
+            uncolored.discard(match_idx)
+            for neighbor in graph.neighbors(match_idx):
+                neighbor_days[neighbor].add(day)
+                uncolored_degree[neighbor] -= 1
+
+        # Hòa thì ưu tiên trận có id nhỏ, hoặc ngẫu nhiên
+        tie_break = [-m if rng is None else rng.random() for m in range(self.total_matches)]
+        
+        while uncolored:
+            match_idx = max(uncolored, key=lambda m: (len(neighbor_days[m]),
+                                                      uncolored_degree[m], tie_break[m]))
+            rest_target = self.min_rest_days
+            if rng is not None:
+                rest_target += rng.randint(0, max_extra_rest)
+            day = self._first_fit_day(match_idx, rest_target)
+            self._place_match(match_idx, day)
+            self.stats['nodes_explored'] += 1
+
+            uncolored.discard(match_idx)
+            for neighbor in graph.neighbors(match_idx):
+                neighbor_days[neighbor].add(day)
+                uncolored_degree[neighbor] -= 1
+
+    def _first_fit_day(self, match_idx: int, rest_target: Optional[int] = None) -> int:
+        """
+        Ngày gợi ý nếu hợp lệ, ngược lại ngày sớm nhất hợp lệ (và cách các
+        trận khác của hai đội ít nhất rest_target ngày nghỉ, nếu có)
+        """
+        hinted_day = self.hint.get(match_idx)
+        if (hinted_day is not None and self._is_usable_hint_day(hinted_day)
+                and self._is_valid_placement(match_idx, hinted_day)):
+            self.stats['hint_hits'] += 1
+            return hinted_day
+
+        match = self.matches[match_idx]
+        team_days = self.team_day_masks[match.team1_id] | self.team_day_masks[match.team2_id]
+        
+        day = 0
+        while not self._is_valid_placement(match_idx, day) or (
+                rest_target is not None and team_days & self._rest_window(day, rest_target)):
+            day += 1
+        return day
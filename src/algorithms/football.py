@@ -0,0 +1,280 @@
+"""
+Phần dùng chung cho các bộ sắp xếp lịch thi đấu bóng đá
+File: src/algorithms/football.py
+
+Danh sách trận (vòng tròn), đồ thị xung đột và trạng thái lịch (đặt / gỡ
+trận, kiểm tra ràng buộc), dùng cho BacktrackingScheduler và DSaturScheduler.
+"""
+
+import logging
+from typing import Dict, List, Optional
+from src.algorithms.base import BaseAlgorithm
+from src.core.conflict_graph import ConflictGraph
+from src.core.problem import SchedulingProblem
+
+logger = logging.getLogger(__name__)
+
+
+class FootballMatch:
+    """Đại diện cho một trận đấu"""
+    def __init__(self, match_id: int, team1_id: int, team2_id: int, 
+                 team1_name: str = "", team2_name: str = ""):
+        self.match_id = match_id
+        self.team1_id = team1_id
+        self.team2_id = team2_id
+        self.team1_name = team1_name
+        self.team2_name = team2_name
+    
+    def __repr__(self):
+        if self.team1_name and self.team2_name:
+            return f"Match({self.team1_name} vs {self.team2_name})"
+        return f"Match({self.team1_id} vs {self.team2_id})"
+
+
+class FootballScheduler(BaseAlgorithm):
+    """
+    Lớp cơ sở cho các bộ sắp xếp lịch thi đấu bóng đá vòng tròn
+    
+    Ràng buộc:
+    1. Mỗi ngày tối đa 2 trận
+    2. Mỗi đội có tối thiểu min_rest_days ngày nghỉ giữa các trận
+    3. Mỗi đội thi đấu với mỗi đội khác đúng 1 lần
+    """
+    
+    def __init__(self, problem: SchedulingProblem, num_teams: int = 8, 
+                 min_rest_days: int = 2, team_names: Dict[int, str] = None):
+        super().__init__(problem)
+        self.num_teams = num_teams
+        self.min_rest_days = min_rest_days
+        
+        # Danh sách tên đội
+        if team_names is None:
+            self.team_names = {i: f"Đội {i}" for i in range(num_teams)}
+        else:
+            self.team_names = team_names
+        
+        # Tạo danh sách tất cả các trận đấu
+        self.matches = self._generate_matches()
+        self.total_matches = len(self.matches)
+        
+        # Đồ thị xung đột (hai trận có chung đội), tính một lần
+        self.conflict_graph = ConflictGraph(
+            (m.team1_id, m.team2_id) for m in self.matches
+        )
+        
+        # Lịch: match_id -> day, lịch sử thi đấu của mỗi đội và các bitset
+        self._reset_state()
+        
+        # Số trận tối đa mỗi ngày
+        self.max_matches_per_day = 2
+        
+        # Số ngày cần thiết: tối thiểu là ceil(total_matches / 2)
+        self.num_days_needed = (self.total_matches + self.max_matches_per_day - 1) // self.max_matches_per_day
+        
+        # Warm start: lịch gợi ý và lịch cố định
+        self.hint = {}
+        self.fixed = {}
+        
+        self._reset_stats()
+        
+        logger.info(f"✓ Initialized Football Scheduler: {num_teams} teams, "
+                   f"{self.total_matches} matches, min {self.num_days_needed} days needed")
+    
+    def _reset_stats(self):
+        """Xóa thống kê"""
+        self.stats = {
+            'nodes_explored': 0,
+            'backtrack_count': 0,
+            'solutions_found': 0,
+            'hint_hits': 0
+        }
+    
+    def _generate_matches(self) -> List[FootballMatch]:
+        """
+        Tạo tất cả các trận đấu (vòng tròn)
+        Mỗi đội thi đấu với mỗi đội khác đúng 1 lần
+        """
+        matches = []
+        match_id = 0
+        
+        for team1_id in range(self.num_teams):
+            for team2_id in range(team1_id + 1, self.num_teams):
+                team1_name = self.team_names[team1_id]
+                team2_name = self.team_names[team2_id]
+                
+                matches.append(FootballMatch(
+                    match_id, team1_id, team2_id, 
+                    team1_name, team2_name
+                ))
+                match_id += 1
+        
+        return matches
+    
+    def _reset_state(self):
+        """Xóa lịch hiện tại"""
+        # Lịch: match_id -> day (ngày thi đấu)
+        self.schedule = {}
+        
+        # Bitset: day -> các trận trong ngày; team_id -> các ngày thi đấu
+        self.day_masks = {}
+        self.day_counts = {}
+        self.team_day_masks = {i: 0 for i in range(self.num_teams)}
+    
+    def _rest_window(self, day: int, gap: Optional[int] = None) -> int:
+        """
+        Bitset các ngày mà một đội không được thi đấu nếu đá vào ngày day
+        (gap mặc định là min_rest_days)
+        """
+        if gap is None:
+            gap = self.min_rest_days
+        low = max(0, day - gap)
+        return ((1 << (day + gap + 1 - low)) - 1) << low
+    
+    def _is_valid_placement(self, match_idx: int, day: int) -> bool:
+        """
+        Kiểm tra xem có thể đặt trận đấu tại ngày này không
+        
+        Kiểm tra:
+        1. Số trận trong ngày không vượt 2
+        2. Mỗi đội có ít nhất 2 ngày nghỉ giữa các trận
+        """
+        match = self.matches[match_idx]
+        team1 = match.team1_id
+        team2 = match.team2_id
+        
+        # Kiểm tra số trận tối đa trong ngày
+        if self.day_counts.get(day, 0) >= self.max_matches_per_day:
+            return False
+        
+        # Kiểm tra hai đội không cùng thi đấu cùng ngày (đồ thị xung đột)
+        if self.conflict_graph.conflicts(match_idx, self.day_masks.get(day, 0)):
+            return False
+        
+        # Kiểm tra rest days cho hai đội (so với mọi ngày đã thi đấu, vì trận
+        # gợi ý / cố định có thể nằm trước hoặc sau ngày đang xét)
+        window = self._rest_window(day)
+        if (self.team_day_masks[team1] | self.team_day_masks[team2]) & window:
+            return False
+        
+        return True
+    
+    def _is_usable_hint_day(self, day: int) -> bool:
+        """
+        Ngày gợi ý có được dùng không: gợi ý chỉ mang tính tham khảo nên bỏ
+        qua ngày âm hoặc quá xa (lịch xếp lần lượt từng trận, mỗi trận cách
+        nhau min_rest_days + 1 ngày, không bao giờ dài hơn giới hạn này)
+        """
+        return 0 <= day < self.total_matches * (self.min_rest_days + 1)
+    
+    def _place_all(self, schedule: Dict[int, int]) -> bool:
+        """
+        Đặt lần lượt các trận trong schedule (theo thứ tự ngày)
+        
+        Returns:
+            False nếu có trận không hợp lệ (id không tồn tại hoặc vi phạm ràng buộc)
+        """
+        for match_idx, day in sorted(schedule.items(), key=lambda x: x[1]):
+            if not 0 <= match_idx < self.total_matches or day < 0:
+                return False
+            if match_idx in self.schedule or not self._is_valid_placement(match_idx, day):
+                return False
+            self._place_match(match_idx, day)
+        return True
+    
+    def _is_feasible(self, schedule: Dict[int, int]) -> bool:
+        """Kiểm tra một lịch có thỏa mọi ràng buộc không (không thay đổi trạng thái)"""
+        saved_state = (self.schedule, self.day_masks, self.day_counts, self.team_day_masks)
+        self._reset_state()
+        
+        feasible = self._place_all(schedule)
+        
+        self.schedule, self.day_masks, self.day_counts, self.team_day_masks = saved_state
+        return feasible
+    
+    def _place_match(self, match_idx: int, day: int):
+        """Đặt trận đấu vào lịch"""
+        match = self.matches[match_idx]
+        self.schedule[match_idx] = day
+        
+        # Cập nhật bitset
+        self.day_masks[day] = self.day_masks.get(day, 0) | (1 << match_idx)
+        self.day_counts[day] = self.day_counts.get(day, 0) + 1
+        self.team_day_masks[match.team1_id] |= 1 << day
+        self.team_day_masks[match.team2_id] |= 1 << day
+    
+    def _remove_match(self, match_idx: int):
+        """Gỡ trận đấu khỏi lịch"""
+        if match_idx not in self.schedule:
+            return
+        
+        match = self.matches[match_idx]
+        day = self.schedule[match_idx]
+        del self.schedule[match_idx]
+        
+        # Cập nhật bitset
+        self.day_masks[day] &= ~(1 << match_idx)
+        self.day_counts[day] -= 1
+        self.team_day_masks[match.team1_id] &= ~(1 << day)
+        self.team_day_masks[match.team2_id] &= ~(1 << day)
+        
+        self.stats['backtrack_count'] += 1
+    
+    def print_schedule(self, schedule: Dict[int, int] = None):
+        """In lịch thi đấu"""
+        if schedule is None:
+            schedule = self.schedule
+        
+        if not schedule:
+            logger.warning("Không có lịch để hiển thị")
+            return
+        
+        print("\n" + "="*80)
+        print("⚽ LỊCH THI ĐẤU BÓNG ĐÁ - VÒNG TRÒN")
+        print("="*80)
+        
+        # Sắp xếp theo ngày
+        days_matches = {}
+        for match_id, day in sorted(schedule.items(), key=lambda x: x[1]):
+            if day not in days_matches:
+                days_matches[day] = []
+            days_matches[day].append(match_id)
+        
+        # In theo ngày
+        for day in sorted(days_matches.keys()):
+            print(f"\n📅 NGÀY {day + 1}:")
+            print("-" * 80)
+            for match_id in days_matches[day]:
+                match = self.matches[match_id]
+                print(f"  Trận {match_id + 1}: {match.team1_name} vs {match.team2_name}")
+        
+        # Thống kê
+        total_days = max(schedule.values()) + 1 if schedule else 0
+        
+        print("\n" + "="*80)
+        print("📊 THỐNG KÊ")
+        print("="*80)
+        print(f"Tổng số trận: {len(schedule)}")
+        print(f"Tổng số ngày: {total_days}")
+        print(f"Trận/ngày: {len(schedule) / total_days:.1f} (Tối đa: {self.max_matches_per_day})")
+        
+        # In lịch thi đấu theo đội
+        print("\n" + "-"*80)
+        print("📋 LỊCH THAM DỰ CỦA MỖI ĐỘI")
+        print("-"*80)
+        
+        for team_id in range(self.num_teams):
+            matches = [(match_id, schedule[match_id]) 
+                      for match_id in schedule 
+                      if team_id in (self.matches[match_id].team1_id, self.matches[match_id].team2_id)]
+            
+            matches.sort(key=lambda x: x[1])
+            
+            team_name = self.team_names[team_id]
+            print(f"\n🏆 {team_name}:")
+            for match_id, day in matches:
+                match = self.matches[match_id]
+                opponent_id = match.team2_id if match.team1_id == team_id else match.team1_id
+                opponent_name = self.team_names[opponent_id]
+                print(f"  Ngày {day + 1}: vs {opponent_name}")
+        
+        print("\n" + "="*80 + "\n")
@@ -0,0 +1,61 @@
+# src/core/conflict_graph.py
+from typing import Dict, Iterable, List, Tuple
+
+
+class ConflictGraph:
+    """
+    Đồ thị xung đột giữa các trận đấu
+
+    Hai trận xung đột nếu có chung một đội. Đồ thị được tính một lần và lưu
+    dưới hai dạng:
+    - adjacency: bitset (int) cho mỗi trận, bit j bật nếu trận j xung đột
+    - indptr / indices: mảng CSR để duyệt danh sách kề
+    """
+
+    def __init__(self, pairs: Iterable[Tuple[int, int]]):
+        pairs = list(pairs)
+        self.num_nodes = len(pairs)
+
+        # Gom các trận theo đội: team_id -> bitset các trận của đội
+        team_masks: Dict[int, int] = {}
+        for idx, (team1, team2) in enumerate(pairs):
+            for team in (team1, team2):
+                team_masks[team] = team_masks.get(team, 0) | (1 << idx)
+        self.team_masks = team_masks
+
+        # Bitset kề: hợp các trận cùng đội, bỏ chính nó
+        self.adjacency: List[int] = []
+        for idx, (team1, team2) in enumerate(pairs):
+            mask = team_masks[team1] | team_masks[team2]
+            self.adjacency.append(mask & ~(1 << idx))
+
+        # CSR
+        self.indptr: List[int] = [0]
+        self.indices: List[int] = []
+        for mask in self.adjacency:
+            self.indices.extend(self.iter_bits(mask))
+            self.indptr.append(len(self.indices))
+
+    @staticmethod
+    def iter_bits(mask: int) -> List[int]:
+        """Danh sách chỉ số các bit bật trong mask (tăng dần)"""
+        bits = []
+        while mask:
+            low = mask & -mask
+            bits.append(low.bit_length() - 1)
+            mask ^= low
+        return bits
+
+    def neighbors(self, node: int) -> List[int]:
+        """Các trận xung đột với node"""
+        return self.indices[self.indptr[node]:self.indptr[node + 1]]
+
+    def degree(self, node: int) -> int:
+        return self.indptr[node + 1] - self.indptr[node]
+
+    def conflicts(self, node: int, mask: int) -> bool:
+        """Kiểm tra node có xung đột với tập trận (bitset) mask không"""
+        return (self.adjacency[node] & mask) != 0
+
+    def __len__(self):
+        return self.num_nodes
@@ -1,7 +1,10 @@
 # src/utils/benchmark.py
 import time
-from typing import List
+from itertools import islice
+from typing import Callable, List, Optional, Sequence
 from src.algorithms.base import BaseAlgorithm
+from src.algorithms.football import FootballScheduler
+from src.utils.pareto import OBJECTIVE_NAMES, ParetoArchive, schedule_objectives
 
 class Benchmark:
     """So sánh hiệu suất các thuật toán"""
@@ -35,4 +38,45 @@ class Benchmark:
             print(f"{result['algorithm']:<20} {result['makespan']:<12} "
                   f"${result['cost']:<11.2f} {result['execution_time']:<12.4f} "
                   f"{result['nodes_explored']:<12}")
-        print("="*80 + "\n")
\ No newline at end of file
+        print("="*80 + "\n")
+    
+    def pareto(self, algorithms: List[BaseAlgorithm], max_size: int = 50,
+               max_candidates: int = 10000,
+               objective_fn: Optional[Callable] = None) -> ParetoArchive:
+        """
+        Chế độ đa mục tiêu: gom các lời giải ứng viên của mọi thuật toán vào
+        một Pareto archive có kích thước tối đa max_size
+        
+        Args:
+            max_candidates: Số ứng viên tối đa lấy từ mỗi thuật toán
+            objective_fn: (algorithm, solution) -> vector mục tiêu (cực tiểu hóa).
+                Mặc định schedule_objectives, chỉ dùng được cho FootballScheduler;
+                thuật toán khác bắt buộc truyền objective_fn
+        """
+        if objective_fn is None:
+            for algo in algorithms:
+                if not isinstance(algo, FootballScheduler):
+                    raise TypeError(f"{algo.get_name()}: cần objective_fn cho thuật toán "
+                                    f"không phải FootballScheduler")
+            objective_fn = schedule_objectives
+        
+        archive = ParetoArchive(max_size)
+        
+        for algo in algorithms:
+            candidates = islice(algo.iter_solutions(), max_candidates)
+            archive.extend((objective_fn(algo, solution), solution) for solution in candidates)
+        
+        return archive
+    
+    def print_pareto(self, archive: ParetoArchive,
+                     objective_names: Sequence[str] = OBJECTIVE_NAMES):
+        """In Pareto front"""
+        print("\n" + "="*80)
+        print("📊 PARETO FRONT")
+        print("="*80)
+        print(f"{'Algorithm':<20} " + " ".join(f"{name:<20}" for name in objective_names))
+        print("-"*80)
+        
+        for point, solution in sorted(archive, key=lambda x: tuple(x[0])):
+            print(f"{solution.algorithm:<20} " + " ".join(f"{value:<20.2f}" for value in point))
+        print("="*80 + "\n")
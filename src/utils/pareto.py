@@ -0,0 +1,202 @@
+# src/utils/pareto.py
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+
+# Các mục tiêu (đều cực tiểu hóa) của schedule_objectives
+OBJECTIVE_NAMES = ('makespan', 'rest_spread', 'home_away_breaks')
+
+
+def schedule_objectives(scheduler, solution) -> np.ndarray:
+    """
+    Vector mục tiêu của một lịch thi đấu (càng nhỏ càng tốt)
+
+    - makespan: số ngày của mùa giải
+    - rest_spread: độ lệch chuẩn số ngày nghỉ giữa hai trận liên tiếp của mỗi đội
+    - home_away_breaks: tổng số "break" (hai trận liên tiếp cùng sân nhà hoặc
+      cùng sân khách) trên chuỗi trận theo ngày của mỗi đội (team1 là đội nhà)
+
+    Sân nhà / sân khách của mỗi trận cố định, nên số break chỉ phụ thuộc thứ
+    tự các trận trong lịch. Chi phí không được dùng vì luôn bằng 0 ở mô hình này.
+    """
+    # team_id -> [(day, có phải sân nhà)]
+    games = {team_id: [] for team_id in range(scheduler.num_teams)}
+    for match_id, day in solution.schedule.items():
+        match = scheduler.matches[match_id]
+        games[match.team1_id].append((day, True))
+        games[match.team2_id].append((day, False))
+
+    # Tính bằng Python thuần: lịch nhỏ, gọi cho hàng chục nghìn ứng viên
+    rest_days = []
+    breaks = 0
+    for team_games in games.values():
+        team_games.sort()
+        for (day_a, home_a), (day_b, home_b) in zip(team_games, team_games[1:]):
+            rest_days.append(day_b - day_a - 1)
+            breaks += home_a == home_b
+    rest_spread = 0.0
+    if rest_days:
+        mean = sum(rest_days) / len(rest_days)
+        rest_spread = (sum((r - mean) ** 2 for r in rest_days) / len(rest_days)) ** 0.5
+
+    return np.array([solution.makespan, rest_spread, breaks], dtype=float)
+
+
+class ParetoArchive:
+    """
+    Kho lưu các lời giải không bị trội (Pareto front), kích thước tối đa max_size
+
+    Mọi mục tiêu đều cực tiểu hóa. Khi kho đầy, phần tử có crowding distance
+    nhỏ nhất (nằm ở vùng dày đặc nhất của front) bị loại.
+    """
+
+    def __init__(self, max_size: int = 100):
+        if max_size < 1:
+            raise ValueError("max_size phải >= 1")
+        self.max_size = max_size
+        self._points: Optional[np.ndarray] = None  # (max_size + 1, num_objectives)
+        self._items: List[Any] = []
+        self._size = 0
+        self._removals = 0  # Số lần kho mất phần tử (để extend lọc lại)
+        self.stats = {
+            'candidates_seen': 0,
+            'accepted': 0,
+            'evicted': 0
+        }
+
+    @property
+    def points(self) -> np.ndarray:
+        """Ma trận mục tiêu của các phần tử trong kho (size x num_objectives)"""
+        if self._points is None:
+            return np.empty((0, 0))
+        return self._points[:self._size]
+
+    @property
+    def items(self) -> List[Any]:
+        return list(self._items)
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self) -> Iterator[Tuple[np.ndarray, Any]]:
+        return iter(zip(self.points, self._items))
+
+    def add(self, objectives: Sequence[float], item: Any = None) -> bool:
+        """
+        Thêm một ứng viên
+
+        Returns:
+            True nếu ứng viên được giữ lại trong kho (không bị trội, không trùng
+            và không bị loại ngay do crowding)
+        """
+        point = np.asarray(objectives, dtype=float)
+        self.stats['candidates_seen'] += 1
+
+        if self._points is None:
+            self._points = np.empty((self.max_size + 1, point.size))
+
+        points = self.points
+        # Bị trội hoặc trùng: có phần tử <= ứng viên ở mọi mục tiêu
+        if np.any(np.all(points <= point, axis=1)):
+            return False
+
+        return self._insert(point, item)
+
+    def extend(self, candidates: Iterable[Tuple[Sequence[float], Any]],
+               batch_size: int = 1024) -> int:
+        """
+        Thêm một dòng ứng viên (objectives, item)
+
+        Ứng viên được xử lý theo lô: mỗi lô được lọc (vector hóa) với kho hiện
+        tại trước khi thêm từng phần tử còn lại. Khi kho mất phần tử (bị trội
+        hoặc bị loại do crowding), phần còn lại của lô được lọc lại, nên kết
+        quả giống hệt gọi add() lần lượt.
+
+        Returns:
+            Số ứng viên được nhận vào kho
+        """
+        accepted = 0
+        candidates = iter(candidates)
+        while True:
+            batch = list(islice(candidates, batch_size))
+            if not batch:
+                break
+
+            batch_points = np.array([np.asarray(obj, dtype=float) for obj, _ in batch])
+            dominated = self._dominated_mask(batch_points)
+
+            for idx, (_, item) in enumerate(batch):
+                if dominated[idx]:
+                    self.stats['candidates_seen'] += 1
+                    continue
+
+                removals = self._removals
+                if self.add(batch_points[idx], item):
+                    accepted += 1
+                if self._removals != removals:
+                    dominated[idx + 1:] = self._dominated_mask(batch_points[idx + 1:])
+
+        return accepted
+
+    def _dominated_mask(self, candidates: np.ndarray) -> np.ndarray:
+        """mask[i]: có phần tử trong kho <= ứng viên i ở mọi mục tiêu (bị trội hoặc trùng)"""
+        if not self._size or not len(candidates):
+            return np.zeros(len(candidates), dtype=bool)
+        return np.all(self.points[:, None, :] <= candidates[None, :, :], axis=2).any(axis=0)
+
+    def crowding_distance(self) -> np.ndarray:
+        """Crowding distance (NSGA-II) của các phần tử; phần tử biên = inf"""
+        points = self.points
+        size = len(points)
+        distance = np.zeros(size)
+        if size <= 2:
+            distance[:] = np.inf
+            return distance
+
+        order = np.argsort(points, axis=0)
+        sorted_points = np.take_along_axis(points, order, axis=0)
+        spread = sorted_points[-1] - sorted_points[0]
+        spread[spread == 0] = 1.0
+
+        gaps = (sorted_points[2:] - sorted_points[:-2]) / spread
+        for objective in range(points.shape[1]):
+            distance[order[1:-1, objective]] += gaps[:, objective]
+            distance[order[[0, -1], objective]] = np.inf
+
+        return distance
+
+    def _insert(self, point: np.ndarray, item: Any) -> bool:
+        """
+        Thêm phần tử không bị trội, loại các phần tử nó trội và giữ kích thước
+
+        Returns:
+            False nếu chính phần tử mới bị loại do crowding
+        """
+        points = self.points
+        # Các phần tử bị ứng viên trội (không trùng vì đã loại ở add)
+        keep = ~np.all(points >= point, axis=1)
+        if not keep.all():
+            kept = int(keep.sum())
+            self._points[:kept] = points[keep]
+            self._items = [it for it, k in zip(self._items, keep) if k]
+            self._size = kept
+            self._removals += 1
+
+        self._points[self._size] = point
+        self._items.append(item)
+        self._size += 1
+
+        victim = None
+        if self._size > self.max_size:
+            victim = int(np.argmin(self.crowding_distance()))
+            last = self._size - 1
+            self._points[victim:last] = self._points[victim + 1:self._size].copy()
+            del self._items[victim]
+            self._size = last
+            self._removals += 1
+            self.stats['evicted'] += 1
+
+        if victim == self._size:
+            return False
+        self.stats['accepted'] += 1
+        return True
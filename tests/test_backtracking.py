@@ -76,9 +76,123 @@ def test_football_rest_days():
     print("✅ test_football_rest_days passed")
 
 
+def _assert_valid_schedule(scheduler, schedule):
+    """Kiểm tra lịch thỏa mọi ràng buộc"""
+    assert len(schedule) == scheduler.total_matches
+    for match_id, day in schedule.items():
+        others = {m_id: d for m_id, d in schedule.items() if m_id != match_id}
+        assert sum(1 for d in others.values() if d == day) < scheduler.max_matches_per_day
+        match = scheduler.matches[match_id]
+        for m_id, d in others.items():
+            other = scheduler.matches[m_id]
+            if {match.team1_id, match.team2_id} & {other.team1_id, other.team2_id}:
+                assert abs(day - d) >= scheduler.min_rest_days + 1
+
+
+def test_football_warm_start_hint():
+    """Test lịch gợi ý đầy đủ làm incumbent, tìm kiếm chỉ nhận lịch ngắn hơn"""
+    problem = SchedulingProblem([], [], 20)
+    scheduler = BacktrackingScheduler(problem, num_teams=8, min_rest_days=2)
+    cold = scheduler.solve()
+    
+    # Dịch toàn bộ lịch 1 ngày -> vẫn hợp lệ, dài hơn lời giải cold start
+    hint = {match_id: day + 1 for match_id, day in cold.schedule.items()}
+    warm = scheduler.solve(hint=hint)
+    
+    assert scheduler.upper_bound == cold.makespan + 1
+    assert warm.makespan < scheduler.upper_bound
+    assert warm.statistics['hint_hits'] > 0
+    _assert_valid_schedule(scheduler, warm.schedule)
+    
+    print("✅ test_football_warm_start_hint passed")
+
+
+def test_football_incumbent_fallback():
+    """Test không tìm được lịch ngắn hơn -> trả về lịch gợi ý (incumbent)"""
+    problem = SchedulingProblem([], [], 20)
+    scheduler = BacktrackingScheduler(problem, num_teams=4, min_rest_days=2)
+    
+    # 4 đội: mỗi đội đá 3 trận cách nhau >= 3 ngày -> tối thiểu 7 ngày
+    hint = {0: 0, 5: 0, 1: 3, 4: 3, 2: 6, 3: 6}
+    solution = scheduler.solve(hint=hint)
+    
+    assert solution.schedule == hint
+    assert solution.makespan == 7
+    
+    print("✅ test_football_incumbent_fallback passed")
+
+
+def test_football_partial_hint():
+    """Test lịch gợi ý một phần / có trận sai vẫn cho lịch hợp lệ"""
+    problem = SchedulingProblem([], [], 20)
+    scheduler = BacktrackingScheduler(problem, num_teams=8, min_rest_days=2)
+    cold = scheduler.solve()
+    
+    hint = dict(cold.schedule)
+    del hint[0]
+    hint[3] += 1  # Vi phạm ngày nghỉ
+    solution = scheduler.solve(hint=hint)
+    
+    assert scheduler.upper_bound is None
+    _assert_valid_schedule(scheduler, solution.schedule)
+    
+    print("✅ test_football_partial_hint passed")
+
+
+def test_football_one_entry_hint_not_worse():
+    """Test gợi ý một trận ở ngày xa không đẩy cả lịch ra sau"""
+    problem = SchedulingProblem([], [], 20)
+    scheduler = BacktrackingScheduler(problem, num_teams=8, min_rest_days=2)
+    cold = scheduler.solve()
+    
+    for hint in ({0: 50}, {0: 30}, {1: 40}, {0: 10 ** 9}):
+        solution = scheduler.solve(hint=hint)
+        assert solution.makespan <= cold.makespan, hint
+        _assert_valid_schedule(scheduler, solution.schedule)
+    
+    print("✅ test_football_one_entry_hint_not_worse passed")
+
+
+def test_football_negative_hint_ignored():
+    """Test ngày gợi ý âm bị bỏ qua, không làm lỗi bộ giải"""
+    problem = SchedulingProblem([], [], 20)
+    scheduler = BacktrackingScheduler(problem, num_teams=8, min_rest_days=2)
+    solution = scheduler.solve(hint={0: -1, 1: -5})
+    
+    assert solution.statistics['hint_hits'] == 0
+    _assert_valid_schedule(scheduler, solution.schedule)
+    
+    print("✅ test_football_negative_hint_ignored passed")
+
+
+def test_football_fixed_pins():
+    """Test các trận cố định được giữ nguyên"""
+    problem = SchedulingProblem([], [], 20)
+    scheduler = BacktrackingScheduler(problem, num_teams=8, min_rest_days=2)
+    
+    fixed = {27: 0, 0: 10}
+    solution = scheduler.solve(fixed=fixed)
+    
+    assert solution.schedule[27] == 0
+    assert solution.schedule[0] == 10
+    _assert_valid_schedule(scheduler, solution.schedule)
+    
+    # Hai trận của cùng một đội trong một ngày -> không có lịch
+    solution = scheduler.solve(fixed={0: 0, 1: 0})
+    assert solution.schedule == {}
+    
+    print("✅ test_football_fixed_pins passed")
+
+
 if __name__ == '__main__':
     test_football_schedule_basic()
     test_football_no_team_conflict()
     test_football_max_matches_per_day()
     test_football_rest_days()
+    test_football_warm_start_hint()
+    test_football_incumbent_fallback()
+    test_football_partial_hint()
+    test_football_one_entry_hint_not_worse()
+    test_football_negative_hint_ignored()
+    test_football_fixed_pins()
     print("\n✅ All football schedule tests passed!")
\ No newline at end of file
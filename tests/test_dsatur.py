@@ -0,0 +1,88 @@
+# tests/test_dsatur.py
+import pytest
+from src.core.problem import SchedulingProblem
+from src.core.conflict_graph import ConflictGraph
+from src.algorithms.backtracking import BacktrackingScheduler
+from src.algorithms.dsatur import DSaturScheduler
+from tests.test_backtracking import _assert_valid_schedule
+
+
+def test_conflict_graph():
+    """Test đồ thị xung đột: hai trận kề nhau khi có chung đội"""
+    graph = ConflictGraph([(0, 1), (0, 2), (1, 2), (3, 4)])
+
+    assert graph.neighbors(0) == [1, 2]
+    assert graph.neighbors(3) == []
+    assert graph.degree(1) == 2
+    assert graph.adjacency[2] == 0b011
+    assert graph.conflicts(0, 1 << 2)
+    assert not graph.conflicts(0, 1 << 3)
+
+    print("✅ test_conflict_graph passed")
+
+
+def test_dsatur_schedule_valid():
+    """Test DSATUR cho lịch hợp lệ với giải nhiều trận"""
+    problem = SchedulingProblem([], [], 20)
+    scheduler = DSaturScheduler(problem, num_teams=20, min_rest_days=2)
+    solution = scheduler.solve()
+
+    assert solution.algorithm == "DSATUR"
+    assert len(solution.schedule) == 190
+    _assert_valid_schedule(scheduler, solution.schedule)
+
+    print("✅ test_dsatur_schedule_valid passed")
+
+
+def test_dsatur_as_backtracking_hint():
+    """Test lời giải DSATUR làm cận trên cho BacktrackingScheduler"""
+    problem = SchedulingProblem([], [], 20)
+    heuristic = DSaturScheduler(problem, num_teams=8, min_rest_days=2).solve()
+
+    scheduler = BacktrackingScheduler(problem, num_teams=8, min_rest_days=2)
+    solution = scheduler.solve(hint=heuristic)
+
+    assert scheduler.upper_bound == heuristic.makespan
+    assert solution.makespan <= heuristic.makespan
+    _assert_valid_schedule(scheduler, solution.schedule)
+
+    print("✅ test_dsatur_as_backtracking_hint passed")
+
+
+def test_dsatur_fixed_pins():
+    """Test DSATUR giữ nguyên các trận cố định"""
+    problem = SchedulingProblem([], [], 20)
+    scheduler = DSaturScheduler(problem, num_teams=8, min_rest_days=2)
+    solution = scheduler.solve(fixed={5: 3})
+
+    assert solution.schedule[5] == 3
+    _assert_valid_schedule(scheduler, solution.schedule)
+
+    print("✅ test_dsatur_fixed_pins passed")
+
+
+def test_dsatur_iter_solutions_diverse():
+    """Test dòng lời giải DSATUR ngẫu nhiên: hợp lệ, giữ trận cố định, đa dạng"""
+    problem = SchedulingProblem([], [], 20)
+    scheduler = DSaturScheduler(problem, num_teams=8, min_rest_days=2)
+    first = scheduler.solve(fixed={5: 3})
+
+    solutions = list(scheduler.iter_solutions(fixed={5: 3}, restarts=20))
+
+    assert len(solutions) == 21
+    assert solutions[0].schedule == first.schedule
+    for solution in solutions:
+        assert solution.schedule[5] == 3
+        _assert_valid_schedule(scheduler, solution.schedule)
+    assert len({solution.makespan for solution in solutions}) > 1
+
+    print("✅ test_dsatur_iter_solutions_diverse passed")
+
+
+if __name__ == '__main__':
+    test_conflict_graph()
+    test_dsatur_schedule_valid()
+    test_dsatur_as_backtracking_hint()
+    test_dsatur_fixed_pins()
+    test_dsatur_iter_solutions_diverse()
+    print("\n✅ All DSATUR tests passed!")
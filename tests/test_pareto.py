@@ -0,0 +1,162 @@
+# tests/test_pareto.py
+import numpy as np
+import pytest
+from src.algorithms.base import BaseAlgorithm
+from src.core.models import Solution
+from src.core.problem import SchedulingProblem
+from src.algorithms.backtracking import BacktrackingScheduler
+from src.algorithms.dsatur import DSaturScheduler
+from src.utils.benchmark import Benchmark
+from src.utils.pareto import ParetoArchive, schedule_objectives
+
+
+def _is_non_dominated(points):
+    for i, p in enumerate(points):
+        for j, q in enumerate(points):
+            if i != j and np.all(q <= p):
+                return False
+    return True
+
+
+def test_pareto_archive_dominance():
+    """Test kho chỉ giữ các điểm không bị trội"""
+    archive = ParetoArchive(max_size=10)
+
+    assert archive.add([3, 3], 'a')
+    assert archive.add([1, 5], 'b')
+    assert not archive.add([4, 4], 'c')  # Bị (3, 3) trội
+    assert not archive.add([3, 3], 'd')  # Trùng
+    assert archive.add([2, 2], 'e')      # Trội (3, 3)
+
+    assert sorted(archive.items) == ['b', 'e']
+    assert _is_non_dominated(archive.points)
+
+    print("✅ test_pareto_archive_dominance passed")
+
+
+def test_pareto_archive_bounded():
+    """Test kho giới hạn kích thước, giữ các điểm biên"""
+    rng = np.random.default_rng(0)
+    x = rng.random(5000)
+    front = np.column_stack([x, 1 - x])  # Mọi điểm đều không bị trội
+    noise = rng.random((5000, 2)) + 1     # Bị trội bởi front
+
+    archive = ParetoArchive(max_size=20)
+    candidates = [(p, i) for i, p in enumerate(np.concatenate([front, noise]))]
+    archive.extend(candidates, batch_size=256)
+
+    assert len(archive) == 20
+    assert archive.stats['candidates_seen'] == 10000
+    assert _is_non_dominated(archive.points)
+    assert archive.points[:, 0].min() == x.min()
+    assert archive.points[:, 0].max() == x.max()
+
+    print("✅ test_pareto_archive_bounded passed")
+
+
+def test_pareto_archive_extend_matches_add():
+    """Test extend() cho cùng kho với add() lần lượt"""
+    rng = np.random.default_rng(1)
+    points = rng.random((3000, 3))
+
+    one_by_one = ParetoArchive(max_size=10)
+    for i, p in enumerate(points):
+        one_by_one.add(p, i)
+
+    batched = ParetoArchive(max_size=10)
+    batched.extend(((p, i) for i, p in enumerate(points)), batch_size=512)
+
+    assert sorted(one_by_one.items) == sorted(batched.items)
+    assert one_by_one.stats == batched.stats
+
+    print("✅ test_pareto_archive_extend_matches_add passed")
+
+
+def test_pareto_archive_new_point_evicted():
+    """Test add() trả về False khi chính điểm mới bị loại do crowding"""
+    archive = ParetoArchive(max_size=2)
+
+    assert archive.add([0, 2], 'a')
+    assert archive.add([2, 0], 'b')
+    assert not archive.add([1, 1], 'c')  # Điểm giữa, crowding nhỏ nhất
+
+    assert sorted(archive.items) == ['a', 'b']
+    assert archive.stats['accepted'] == 2
+    assert archive.stats['evicted'] == 1
+
+    print("✅ test_pareto_archive_new_point_evicted passed")
+
+
+def test_schedule_objectives():
+    """Test vector mục tiêu của lịch thi đấu"""
+    problem = SchedulingProblem([], [], 20)
+    scheduler = BacktrackingScheduler(problem, num_teams=8, min_rest_days=2)
+    solution = scheduler.solve()
+
+    objectives = schedule_objectives(scheduler, solution)
+
+    assert objectives.shape == (3,)
+    assert objectives[0] == solution.makespan
+    assert objectives[1] >= 0
+
+    # Số break phụ thuộc thứ tự các trận của mỗi đội
+    scheduler = BacktrackingScheduler(problem, num_teams=4, min_rest_days=2)
+    in_order = Solution({m: 3 * m for m in range(6)}, 16, 0.0, "test", 0.0)
+    reordered = Solution({3: 0, 0: 3, 4: 6, 1: 9, 5: 12, 2: 15}, 16, 0.0, "test", 0.0)
+
+    assert schedule_objectives(scheduler, in_order)[2] == 6
+    assert schedule_objectives(scheduler, reordered)[2] == 5
+
+    print("✅ test_schedule_objectives passed")
+
+
+def test_benchmark_pareto():
+    """Test chế độ đa mục tiêu cho front có đánh đổi, kho đầy thì loại bớt"""
+    problem = SchedulingProblem([], [], 20)
+    algorithms = [
+        DSaturScheduler(problem, num_teams=8, min_rest_days=2),
+        BacktrackingScheduler(problem, num_teams=8, min_rest_days=2),
+    ]
+
+    archive = Benchmark().pareto(algorithms, max_size=4, max_candidates=200)
+
+    assert 1 < len(archive) <= 4
+    assert archive.stats['evicted'] >= 1
+    assert _is_non_dominated(archive.points)
+    # Các điểm đánh đổi nhau: không mục tiêu nào giống hệt ở mọi điểm
+    assert np.all(archive.points.max(axis=0) > archive.points.min(axis=0))
+
+    print("✅ test_benchmark_pareto passed")
+
+
+def test_benchmark_pareto_requires_objective_fn():
+    """Test thuật toán không phải FootballScheduler phải có objective_fn"""
+    class Dummy(BaseAlgorithm):
+        def solve(self, hint=None, fixed=None):
+            return Solution({1: 0}, 1, 2.0, "Dummy", 0.0)
+
+        def get_name(self):
+            return "Dummy"
+
+    problem = SchedulingProblem([], [], 20)
+
+    with pytest.raises(TypeError):
+        Benchmark().pareto([Dummy(problem)])
+
+    archive = Benchmark().pareto(
+        [Dummy(problem)],
+        objective_fn=lambda algo, solution: [solution.makespan, solution.total_cost])
+    assert len(archive) == 1
+
+    print("✅ test_benchmark_pareto_requires_objective_fn passed")
+
+
+if __name__ == '__main__':
+    test_pareto_archive_dominance()
+    test_pareto_archive_bounded()
+    test_pareto_archive_extend_matches_add()
+    test_pareto_archive_new_point_evicted()
+    test_schedule_objectives()
+    test_benchmark_pareto()
+    test_benchmark_pareto_requires_objective_fn()
+    print("\n✅ All Pareto tests passed!")